@@ -3,7 +3,8 @@
 import { useAnalysisStore } from '@/stores/analysisStore';
 import { getStep1Summary } from '@/lib/analysis/step1';
 import { getStep3Summary } from '@/lib/analysis/step3';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import {
   Plane,
   Users,
@@ -125,7 +126,7 @@ function MetricCard({
 
 export function MetricsBar() {
   const t = useTranslations('metrics');
-  const locale = useLocale();
+  const formatNumber = useNumberFormatter();
   const { step1Results, step3Results, threshold } = useAnalysisStore();
 
   if (!step1Results || !step3Results) {
@@ -134,7 +135,6 @@ export function MetricsBar() {
 
   const step1Summary = getStep1Summary(step1Results);
   const step3Summary = getStep3Summary(step3Results, threshold || 0);
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
 
   // Count unique airlines with routes above threshold (WATCH_LIST or HIGH_PRIORITY) in Step 3
   const step3Airlines = new Set(step3Results.map(r => r.airline));
@@ -158,7 +158,7 @@ export function MetricsBar() {
       <div className="grid grid-cols-2 md:grid-cols-3 lg:grid-cols-6 gap-4">
         <MetricCard
           label={t('totalInads')}
-          value={step1Summary.totalInads.toLocaleString(localeFormat)}
+          value={formatNumber(step1Summary.totalInads)}
           description={t('totalInadsDesc')}
           icon={<Plane className="w-5 h-5" />}
           variant="primary"
@@ -11,12 +11,12 @@ import {
   Github,
   Loader2,
 } from 'lucide-react';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useDateFormatter } from '@/i18n/format';
 
 export function PublishDialog() {
   const t = useTranslations('publish');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatDateTime = useDateFormatter('dateTime');
   const { csrfToken } = useAuth();
 
   const {
@@ -94,7 +94,7 @@ export function PublishDialog() {
       }
 
       setPublishSuccess(true);
-      setLastPublished(new Date().toLocaleString(localeFormat));
+      setLastPublished(formatDateTime(new Date()));
       setTimeout(() => setPublishSuccess(false), 5000);
     } catch (error) {
       console.error('Publish error:', error);
@@ -1,7 +1,8 @@
 'use client';
 
 import { SwissCoat } from '@/components/ui/swiss-coat';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useDateFormatter } from '@/i18n/format';
 
 interface FooterProps {
   version?: string;
@@ -11,13 +12,9 @@ interface FooterProps {
 export function Footer({ version = '1.0.0', lastUpdated }: FooterProps) {
   const t = useTranslations('footer');
   const tHeader = useTranslations('header');
-  const locale = useLocale();
+  const formatDate = useDateFormatter('date');
   const currentYear = new Date().getFullYear();
-  const formattedDate = lastUpdated || new Date().toLocaleDateString(locale === 'fr' ? 'fr-CH' : 'de-CH', {
-    year: 'numeric',
-    month: '2-digit',
-    day: '2-digit',
-  });
+  const formattedDate = lastUpdated || formatDate(new Date());
 
   return (
     <footer className="bg-neutral-900 text-white" role="contentinfo">
@@ -18,8 +18,10 @@ import {
 import { useState } from 'react';
 import { cn } from '@/lib/utils';
 
+type NavTab = 'dashboard' | 'pax' | 'inad' | 'trends' | 'docs';
+
 interface NavItem {
-  labelKey: string;
+  labelKey: `nav.${NavTab}`;
   icon: React.ReactNode;
   href: string;
 }
@@ -11,30 +11,31 @@ interface PriorityBadgeProps {
   showIcon?: boolean;
 }
 
+// Static per-priority config, so a badge only translates its own two labels
+const PRIORITY_CONFIG = {
+  HIGH_PRIORITY: {
+    labelKey: 'sanction',
+    shortLabelKey: 'sanctionShort',
+    icon: AlertTriangle,
+    styles: 'bg-red-50 text-red-900 border-red-600',
+  },
+  WATCH_LIST: {
+    labelKey: 'watchList',
+    shortLabelKey: 'watchListShort',
+    icon: Eye,
+    styles: 'bg-amber-50 text-amber-900 border-amber-600',
+  },
+  CLEAR: {
+    labelKey: 'clear',
+    shortLabelKey: 'clearShort',
+    icon: CheckCircle,
+    styles: 'bg-green-50 text-green-900 border-green-600',
+  },
+} as const;
+
 export function PriorityBadge({ priority, className, showIcon = true }: PriorityBadgeProps) {
   const t = useTranslations('priority');
 
-  const PRIORITY_CONFIG = {
-    HIGH_PRIORITY: {
-      label: t('sanction'),
-      shortLabel: t('sanctionShort'),
-      icon: AlertTriangle,
-      styles: 'bg-red-50 text-red-900 border-red-600',
-    },
-    WATCH_LIST: {
-      label: t('watchList'),
-      shortLabel: t('watchListShort'),
-      icon: Eye,
-      styles: 'bg-amber-50 text-amber-900 border-amber-600',
-    },
-    CLEAR: {
-      label: t('clear'),
-      shortLabel: t('clearShort'),
-      icon: CheckCircle,
-      styles: 'bg-green-50 text-green-900 border-green-600',
-    },
-  } as const;
-
   const config = PRIORITY_CONFIG[priority];
   const Icon = config.icon;
 
@@ -49,8 +50,8 @@ export function PriorityBadge({ priority, className, showIcon = true }: Priority
       )}
     >
       {showIcon && <Icon className="w-3.5 h-3.5" />}
-      <span className="hidden sm:inline">{config.label}</span>
-      <span className="sm:hidden">{config.shortLabel}</span>
+      <span className="hidden sm:inline">{t(config.labelKey)}</span>
+      <span className="sm:hidden">{t(config.shortLabelKey)}</span>
     </span>
   );
 }
@@ -3,7 +3,8 @@
 import { useMemo } from 'react';
 import { useAnalysisStore } from '@/stores/analysisStore';
 import { FileWarning, MapPin, Users, Globe } from 'lucide-react';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import {
   BarChart,
   Bar,
@@ -17,15 +18,13 @@ import {
   Pie,
 } from 'recharts';
 import { ChartWrapper } from '@/components/ui/ChartWrapper';
-
-// Refusal codes that are excluded from analysis
-const EXCLUDE_CODES = ['B1n', 'B2n', 'C4n', 'C5n', 'C8', 'D1n', 'D2n', 'E', 'F1n', 'G', 'H', 'I'];
+import { EXCLUDE_CODES } from '@/lib/analysis/constants';
+import { isInSemester } from '@/lib/analysis/semester';
 
 export function InadTab() {
   const t = useTranslations('inad');
-  const locale = useLocale();
+  const formatNumber = useNumberFormatter();
   const { inadData, selectedSemester } = useAnalysisStore();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
 
   // Calculate aggregated data for the selected semester
   const { topLastStops, topAirlines, totalInad, includedInad, excludedInad, byRefusalCode } = useMemo(() => {
@@ -40,37 +39,27 @@ export function InadTab() {
       };
     }
 
-    // Filter by semester
-    const startMonth = selectedSemester.half === 1 ? 1 : 7;
-    const endMonth = selectedSemester.half === 1 ? 6 : 12;
-    const filtered = inadData.filter(
-      (r) => r.year === selectedSemester.year && r.month >= startMonth && r.month <= endMonth
-    );
-
-    // Count included vs excluded
-    const included = filtered.filter((r) => r.included);
-    const excluded = filtered.filter((r) => !r.included);
-
-    // Aggregate by Last Stop (only included)
+    // Single pass over the records: semester filter, included vs excluded
+    // counts, and aggregation by last stop, airline and refusal code
     const byLastStop = new Map<string, number>();
-    for (const record of included) {
-      const current = byLastStop.get(record.lastStop) || 0;
-      byLastStop.set(record.lastStop, current + 1);
-    }
-
-    // Aggregate by Airline (only included)
     const byAirline = new Map<string, number>();
-    for (const record of included) {
-      const current = byAirline.get(record.airline) || 0;
-      byAirline.set(record.airline, current + 1);
-    }
-
-    // Aggregate by refusal code (all records)
     const refusalCodes = new Map<string, number>();
-    for (const record of filtered) {
+    let totalInad = 0;
+    let includedInad = 0;
+
+    for (const record of inadData) {
+      if (!isInSemester(record, selectedSemester)) continue;
+      totalInad++;
+
+      // Refusal codes are aggregated over all records
       const code = record.refusalCode || 'Unknown';
-      const current = refusalCodes.get(code) || 0;
-      refusalCodes.set(code, current + 1);
+      refusalCodes.set(code, (refusalCodes.get(code) || 0) + 1);
+
+      // Last stops and airlines only count included records
+      if (!record.included) continue;
+      includedInad++;
+      byLastStop.set(record.lastStop, (byLastStop.get(record.lastStop) || 0) + 1);
+      byAirline.set(record.airline, (byAirline.get(record.airline) || 0) + 1);
     }
 
     // Sort and take top 10
@@ -89,7 +78,7 @@ export function InadTab() {
       .map(([code, count]) => ({
         name: code,
         value: count,
-        excluded: EXCLUDE_CODES.includes(code),
+        excluded: EXCLUDE_CODES.has(code),
       }))
       .sort((a, b) => b.value - a.value)
       .slice(0, 10);
@@ -97,9 +86,9 @@ export function InadTab() {
     return {
       topLastStops,
       topAirlines,
-      totalInad: filtered.length,
-      includedInad: included.length,
-      excludedInad: excluded.length,
+      totalInad,
+      includedInad,
+      excludedInad: totalInad - includedInad,
       byRefusalCode,
     };
   }, [inadData, selectedSemester]);
@@ -154,7 +143,7 @@ export function InadTab() {
             </span>
           </div>
           <p className="text-2xl font-bold text-neutral-900">
-            {totalInad.toLocaleString(localeFormat)}
+            {formatNumber(totalInad)}
           </p>
         </div>
         <div className="bg-white border border-neutral-200 p-4">
@@ -165,7 +154,7 @@ export function InadTab() {
             </span>
           </div>
           <p className="text-2xl font-bold text-green-700">
-            {includedInad.toLocaleString(localeFormat)}
+            {formatNumber(includedInad)}
           </p>
         </div>
         <div className="bg-white border border-neutral-200 p-4">
@@ -176,7 +165,7 @@ export function InadTab() {
             </span>
           </div>
           <p className="text-2xl font-bold text-neutral-500">
-            {excludedInad.toLocaleString(localeFormat)}
+            {formatNumber(excludedInad)}
           </p>
         </div>
         <div className="bg-white border border-neutral-200 p-4">
@@ -220,7 +209,7 @@ export function InadTab() {
                   ))}
                 </Pie>
                 <Tooltip
-                  formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('cases')]}
+                  formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('cases')]}
                   contentStyle={{
                     backgroundColor: '#fff',
                     border: '1px solid #e5e5e5',
@@ -236,7 +225,7 @@ export function InadTab() {
               <div>
                 <p className="font-medium text-neutral-900">{t('includedLabel')}</p>
                 <p className="text-sm text-neutral-500">
-                  {t('includedDescription', { count: includedInad.toLocaleString(localeFormat) })}
+                  {t('includedDescription', { count: formatNumber(includedInad) })}
                 </p>
               </div>
             </div>
@@ -245,7 +234,7 @@ export function InadTab() {
               <div>
                 <p className="font-medium text-neutral-900">{t('excludedLabel')}</p>
                 <p className="text-sm text-neutral-500">
-                  {t('excludedDescription', { count: excludedInad.toLocaleString(localeFormat) })}
+                  {t('excludedDescription', { count: formatNumber(excludedInad) })}
                 </p>
               </div>
             </div>
@@ -280,7 +269,7 @@ export function InadTab() {
                     width={45}
                   />
                   <Tooltip
-                    formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('inadCases')]}
+                    formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('inadCases')]}
                     contentStyle={{
                       backgroundColor: '#fff',
                       border: '1px solid #e5e5e5',
@@ -327,7 +316,7 @@ export function InadTab() {
                     width={45}
                   />
                   <Tooltip
-                    formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('inadCases')]}
+                    formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('inadCases')]}
                     contentStyle={{
                       backgroundColor: '#fff',
                       border: '1px solid #e5e5e5',
@@ -375,7 +364,7 @@ export function InadTab() {
                 />
                 <Tooltip
                   formatter={(value, name, props) => [
-                    `${typeof value === 'number' ? value.toLocaleString(localeFormat) : '–'} ${t('cases')}${(props as { payload: { excluded: boolean } }).payload.excluded ? ` (${t('excluded').toLowerCase()})` : ''}`,
+                    `${typeof value === 'number' ? formatNumber(value) : '–'} ${t('cases')}${(props as { payload: { excluded: boolean } }).payload.excluded ? ` (${t('excluded').toLowerCase()})` : ''}`,
                     t('count'),
                   ]}
                   contentStyle={{
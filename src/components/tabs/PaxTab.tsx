@@ -2,8 +2,10 @@
 
 import { useMemo } from 'react';
 import { useAnalysisStore } from '@/stores/analysisStore';
+import { filterBySemester } from '@/lib/analysis/semester';
 import { Plane, MapPin, TrendingUp, Users } from 'lucide-react';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import {
   BarChart,
   Bar,
@@ -18,9 +20,8 @@ import { ChartWrapper } from '@/components/ui/ChartWrapper';
 
 export function PaxTab() {
   const t = useTranslations('pax');
-  const locale = useLocale();
+  const formatNumber = useNumberFormatter();
   const { bazlData, selectedSemester } = useAnalysisStore();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
 
   // Calculate aggregated data for the selected semester
   const { topLastStops, topAirlines, totalPax, uniqueRoutes } = useMemo(() => {
@@ -29,11 +30,7 @@ export function PaxTab() {
     }
 
     // Filter by semester
-    const startMonth = selectedSemester.half === 1 ? 1 : 7;
-    const endMonth = selectedSemester.half === 1 ? 6 : 12;
-    const filtered = bazlData.filter(
-      (r) => r.year === selectedSemester.year && r.month >= startMonth && r.month <= endMonth
-    );
+    const filtered = filterBySemester(bazlData, selectedSemester);
 
     // Aggregate by Last Stop (airport)
     const byLastStop = new Map<string, number>();
@@ -117,7 +114,7 @@ export function PaxTab() {
             </span>
           </div>
           <p className="text-2xl font-bold text-neutral-900">
-            {totalPax.toLocaleString(localeFormat)}
+            {formatNumber(totalPax)}
           </p>
         </div>
         <div className="bg-white border border-neutral-200 p-4">
@@ -128,7 +125,7 @@ export function PaxTab() {
             </span>
           </div>
           <p className="text-2xl font-bold text-neutral-900">
-            {uniqueRoutes.toLocaleString(localeFormat)}
+            {formatNumber(uniqueRoutes)}
           </p>
         </div>
         <div className="bg-white border border-neutral-200 p-4">
@@ -173,7 +170,7 @@ export function PaxTab() {
                   <CartesianGrid strokeDasharray="3 3" stroke="#e5e5e5" />
                   <XAxis
                     type="number"
-                    tickFormatter={(value) => value.toLocaleString(localeFormat)}
+                    tickFormatter={(value) => formatNumber(value)}
                     tick={{ fontSize: 12, fill: '#737373' }}
                   />
                   <YAxis
@@ -183,7 +180,7 @@ export function PaxTab() {
                     width={45}
                   />
                   <Tooltip
-                    formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('passengers')]}
+                    formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('passengers')]}
                     contentStyle={{
                       backgroundColor: '#fff',
                       border: '1px solid #e5e5e5',
@@ -221,7 +218,7 @@ export function PaxTab() {
                   <CartesianGrid strokeDasharray="3 3" stroke="#e5e5e5" />
                   <XAxis
                     type="number"
-                    tickFormatter={(value) => value.toLocaleString(localeFormat)}
+                    tickFormatter={(value) => formatNumber(value)}
                     tick={{ fontSize: 12, fill: '#737373' }}
                   />
                   <YAxis
@@ -231,7 +228,7 @@ export function PaxTab() {
                     width={45}
                   />
                   <Tooltip
-                    formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('passengers')]}
+                    formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('passengers')]}
                     contentStyle={{
                       backgroundColor: '#fff',
                       border: '1px solid #e5e5e5',
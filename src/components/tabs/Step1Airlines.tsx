@@ -7,7 +7,7 @@ import { Badge } from '@/components/ui/badge';
 import { Button } from '@/components/ui/button';
 import type { Step1Result } from '@/lib/analysis/types';
 import { getStep1Summary } from '@/lib/analysis/step1';
-import { toSafeCsvField } from '@/lib/csv';
+import { toSafeCsvField, downloadCsv } from '@/lib/csv';
 import { useTranslations } from 'next-intl';
 
 // CSV export with Swiss format (semicolon separator)
@@ -19,19 +19,10 @@ function exportToCSV(data: Step1Result[], minInad: number) {
     row.passesThreshold ? 'Check' : 'OK',
   ]);
 
-  const csvContent = [
-    headers.join(';'),
-    ...rows.map((row) => row.join(';')),
-    '',
-    `Min INAD Threshold;${minInad}`,
-  ].join('\n');
-
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-  const link = document.createElement('a');
-  link.href = URL.createObjectURL(blob);
-  link.download = `casa-airlines-${new Date().toISOString().split('T')[0]}.csv`;
-  link.click();
-  URL.revokeObjectURL(link.href);
+  downloadCsv(
+    `casa-airlines-${new Date().toISOString().split('T')[0]}.csv`,
+    [headers, ...rows, [], ['Min INAD Threshold', String(minInad)]]
+  );
 }
 
 export function Step1Airlines() {
@@ -7,7 +7,7 @@ import { Badge } from '@/components/ui/badge';
 import { Button } from '@/components/ui/button';
 import type { Step2Result } from '@/lib/analysis/types';
 import { getStep2Summary } from '@/lib/analysis/step2';
-import { toSafeCsvField } from '@/lib/csv';
+import { toSafeCsvField, downloadCsv } from '@/lib/csv';
 import { useTranslations } from 'next-intl';
 
 // CSV export with Swiss format (semicolon separator)
@@ -20,19 +20,10 @@ function exportToCSV(data: Step2Result[], minInad: number) {
     row.passesThreshold ? 'Check' : 'OK',
   ]);
 
-  const csvContent = [
-    headers.join(';'),
-    ...rows.map((row) => row.join(';')),
-    '',
-    `Min INAD Threshold;${minInad}`,
-  ].join('\n');
-
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-  const link = document.createElement('a');
-  link.href = URL.createObjectURL(blob);
-  link.download = `casa-routes-step2-${new Date().toISOString().split('T')[0]}.csv`;
-  link.click();
-  URL.revokeObjectURL(link.href);
+  downloadCsv(
+    `casa-routes-step2-${new Date().toISOString().split('T')[0]}.csv`,
+    [headers, ...rows, [], ['Min INAD Threshold', String(minInad)]]
+  );
 }
 
 export function Step2Routes() {
@@ -9,8 +9,9 @@ import { Card, CardContent } from '@/components/ui/card';
 import type { Step3Result } from '@/lib/analysis/types';
 import { getStep3Summary } from '@/lib/analysis/step3';
 import { PRIORITY_LABELS } from '@/lib/analysis/constants';
-import { toSafeCsvField } from '@/lib/csv';
-import { useTranslations, useLocale } from 'next-intl';
+import { toSafeCsvField, downloadCsv } from '@/lib/csv';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 
 // Priority order for sorting (above threshold first, then below)
 const PRIORITY_ORDER: Record<string, number> = {
@@ -31,28 +32,19 @@ function exportToCSV(data: Step3Result[], threshold: number) {
     toSafeCsvField(PRIORITY_LABELS[row.priority]),
   ]);
 
-  const csvContent = [
-    headers.join(';'),
-    ...rows.map((row) => row.join(';')),
-    '',
-    `Threshold;${threshold.toFixed(3)}‰`,
-  ].join('\n');
-
-  const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-  const link = document.createElement('a');
-  link.href = URL.createObjectURL(blob);
-  link.download = `inad_analysis_step3_${new Date().toISOString().split('T')[0]}.csv`;
-  link.click();
+  downloadCsv(
+    `inad_analysis_step3_${new Date().toISOString().split('T')[0]}.csv`,
+    [headers, ...rows, [], ['Threshold', `${threshold.toFixed(3)}‰`]]
+  );
 }
 
 export function Step3Density() {
   const t = useTranslations('steps.step3');
   const tTable = useTranslations('table');
   const tPriority = useTranslations('priority');
-  const locale = useLocale();
+  const formatNumber = useNumberFormatter();
   const { step3Results, threshold, config } = useAnalysisStore();
   const [statusFilter, setStatusFilter] = useState<'all' | 'critical' | 'watch' | 'clear'>('all');
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
   const normalizedResults = step3Results ?? EMPTY_STEP3_RESULTS;
   const summary = getStep3Summary(normalizedResults, threshold || 0);
 
@@ -100,7 +92,7 @@ export function Step3Density() {
       header: tTable('pax'),
       sortable: true,
       align: 'right',
-      render: (row) => row.pax.toLocaleString(localeFormat),
+      render: (row) => formatNumber(row.pax),
     },
     {
       key: 'density',
@@ -2,8 +2,10 @@
 
 import { useMemo, useState } from 'react';
 import { useAnalysisStore } from '@/stores/analysisStore';
+import { getSemesterTotals } from '@/lib/analysis/semester';
 import { TrendingUp, TrendingDown, Minus, BarChart3, Info, ArrowRightLeft } from 'lucide-react';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import {
   LineChart,
   Line,
@@ -46,8 +48,7 @@ function TrendIndicator({ value }: { value: number }) {
 export function TrendsTab() {
   const { inadData, bazlData, availableSemesters } = useAnalysisStore();
   const t = useTranslations('trends');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatNumber = useNumberFormatter();
 
   // State for semester comparison selection
   const [compareSemester1, setCompareSemester1] = useState<string | null>(null);
@@ -65,29 +66,11 @@ export function TrendsTab() {
       return a.half - b.half;
     });
 
-    return sortedSemesters.map((semester) => {
-      const startMonth = semester.half === 1 ? 1 : 7;
-      const endMonth = semester.half === 1 ? 6 : 12;
-
-      // Filter INAD data
-      const semesterInad = inadData.filter(
-        (r) =>
-          r.year === semester.year &&
-          r.month >= startMonth &&
-          r.month <= endMonth &&
-          r.included
-      );
-
-      // Filter BAZL data
-      const semesterBazl = bazlData.filter(
-        (r) =>
-          r.year === semester.year &&
-          r.month >= startMonth &&
-          r.month <= endMonth
-      );
-
-      const inadCount = semesterInad.length;
-      const paxCount = semesterBazl.reduce((sum, r) => sum + r.pax, 0);
+    const semesterTotals = getSemesterTotals(inadData, bazlData, sortedSemesters);
+
+    return sortedSemesters.map((semester, i) => {
+      const { inadCount, paxCount } = semesterTotals[i];
+
       const density = paxCount > 0 ? (inadCount / paxCount) * 1000 : 0;
 
       return {
@@ -268,13 +251,13 @@ export function TrendsTab() {
                 <div className="flex justify-between items-baseline">
                   <span className="text-xs text-neutral-500">{comparisonData.semester1.semester}</span>
                   <span className="text-lg font-semibold text-neutral-700">
-                    {comparisonData.semester1.pax.toLocaleString(localeFormat)}
+                    {formatNumber(comparisonData.semester1.pax)}
                   </span>
                 </div>
                 <div className="flex justify-between items-baseline">
                   <span className="text-xs text-neutral-500">{comparisonData.semester2.semester}</span>
                   <span className="text-2xl font-bold text-neutral-900">
-                    {comparisonData.semester2.pax.toLocaleString(localeFormat)}
+                    {formatNumber(comparisonData.semester2.pax)}
                   </span>
                 </div>
               </div>
@@ -301,13 +284,13 @@ export function TrendsTab() {
                 <div className="flex justify-between items-baseline">
                   <span className="text-xs text-neutral-500">{comparisonData.semester1.semester}</span>
                   <span className="text-lg font-semibold text-neutral-700">
-                    {comparisonData.semester1.inad.toLocaleString(localeFormat)}
+                    {formatNumber(comparisonData.semester1.inad)}
                   </span>
                 </div>
                 <div className="flex justify-between items-baseline">
                   <span className="text-xs text-neutral-500">{comparisonData.semester2.semester}</span>
                   <span className="text-2xl font-bold text-neutral-900">
-                    {comparisonData.semester2.inad.toLocaleString(localeFormat)}
+                    {formatNumber(comparisonData.semester2.inad)}
                   </span>
                 </div>
               </div>
@@ -379,7 +362,7 @@ export function TrendsTab() {
                 tick={{ fontSize: 12, fill: '#737373' }}
               />
               <Tooltip
-                formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('passengers')]}
+                formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('passengers')]}
                 contentStyle={{
                   backgroundColor: '#fff',
                   border: '1px solid #e5e5e5',
@@ -427,7 +410,7 @@ export function TrendsTab() {
                 tick={{ fontSize: 12, fill: '#737373' }}
               />
               <Tooltip
-                formatter={(value) => [typeof value === 'number' ? value.toLocaleString(localeFormat) : '–', t('refusals')]}
+                formatter={(value) => [typeof value === 'number' ? formatNumber(value) : '–', t('refusals')]}
                 contentStyle={{
                   backgroundColor: '#fff',
                   border: '1px solid #e5e5e5',
@@ -2,14 +2,14 @@
 
 import { useTransition } from 'react';
 import { useLocale } from 'next-intl';
-import { locales, type Locale } from '@/i18n/config';
+import { locales, localeNames, type Locale } from '@/i18n/config';
 import Cookies from 'js-cookie';
 import { cn } from '@/lib/utils';
 
 const LOCALE_COOKIE = 'NEXT_LOCALE';
 
 export function LanguagePicker() {
-  const locale = useLocale() as Locale;
+  const locale = useLocale();
   const [isPending, startTransition] = useTransition();
 
   const handleLocaleChange = (newLocale: Locale) => {
@@ -52,7 +52,7 @@ export function LanguagePicker() {
                 : 'text-neutral-400 hover:text-white'
             )}
             aria-current={locale === loc ? 'true' : undefined}
-            aria-label={loc === 'de' ? 'Deutsch' : 'Français'}
+            aria-label={localeNames[loc]}
           >
             {loc.toUpperCase()}
           </button>
@@ -2,9 +2,10 @@
 
 import { useState, useMemo, useCallback } from 'react';
 import { useViewerStore } from '@/stores/viewerStore';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import { cn } from '@/lib/utils';
-import { toSafeCsvField } from '@/lib/csv';
+import { toSafeCsvField, downloadCsv } from '@/lib/csv';
 import {
   Users,
   AlertTriangle,
@@ -31,8 +32,7 @@ export function ViewerDashboard() {
   const tTable = useTranslations('table');
   const tPriority = useTranslations('priority');
   const tSteps = useTranslations('steps');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatNumber = useNumberFormatter();
 
   const [activeStep, setActiveStep] = useState<1 | 2 | 3>(3);
   const [step1Filter, setStep1Filter] = useState<'all' | 'check' | 'ok'>('all');
@@ -99,22 +99,10 @@ export function ViewerDashboard() {
       row.aboveThreshold ? 'Check' : 'OK',
     ]);
 
-    const csvContent = [
-      headers.join(';'),
-      ...rows.map((row) => row.join(';')),
-      '',
-      `Min INAD Threshold;${config.minInad}`,
-    ].join('\n');
-
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-    const url = URL.createObjectURL(blob);
-    const link = document.createElement('a');
-    link.href = url;
-    link.download = `casa-airlines-${semester.replace(' ', '-')}.csv`;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
-    URL.revokeObjectURL(url);
+    downloadCsv(
+      `casa-airlines-${semester.replace(' ', '-')}.csv`,
+      [headers, ...rows, [], ['Min INAD Threshold', String(config.minInad)]]
+    );
   }, [airlines, config.minInad, semester]);
 
   // CSV Export for Step 2 (Routes)
@@ -128,22 +116,10 @@ export function ViewerDashboard() {
       row.inadCount >= config.minInad ? 'Check' : 'OK',
     ]);
 
-    const csvContent = [
-      headers.join(';'),
-      ...rows.map((row) => row.join(';')),
-      '',
-      `Min INAD Threshold;${config.minInad}`,
-    ].join('\n');
-
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-    const url = URL.createObjectURL(blob);
-    const link = document.createElement('a');
-    link.href = url;
-    link.download = `casa-routes-step2-${semester.replace(' ', '-')}.csv`;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
-    URL.revokeObjectURL(url);
+    downloadCsv(
+      `casa-routes-step2-${semester.replace(' ', '-')}.csv`,
+      [headers, ...rows, [], ['Min INAD Threshold', String(config.minInad)]]
+    );
   }, [routes, config.minInad, semester]);
 
   // CSV Export for Step 3 (Routes with density)
@@ -168,20 +144,7 @@ export function ViewerDashboard() {
       toSafeCsvField(route.classification),
     ]);
 
-    const csvContent = [
-      headers.join(';'),
-      ...rows.map((row) => row.join(';')),
-    ].join('\n');
-
-    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
-    const url = URL.createObjectURL(blob);
-    const link = document.createElement('a');
-    link.href = url;
-    link.download = `casa-routes-${semester.replace(' ', '-')}.csv`;
-    document.body.appendChild(link);
-    link.click();
-    document.body.removeChild(link);
-    URL.revokeObjectURL(url);
+    downloadCsv(`casa-routes-${semester.replace(' ', '-')}.csv`, [headers, ...rows]);
   }, [routes, semester]);
 
   // DataTable columns for Step 1 (Airlines)
@@ -252,7 +215,7 @@ export function ViewerDashboard() {
       sortable: true,
       align: 'right' as const,
       render: (row) => (
-        <span className="text-neutral-600">{row.pax.toLocaleString(localeFormat)}</span>
+        <span className="text-neutral-600">{formatNumber(row.pax)}</span>
       ),
     },
     {
@@ -370,7 +333,7 @@ export function ViewerDashboard() {
             </span>
           </div>
           <p className="text-3xl font-bold text-neutral-900">
-            {summary.totalInads.toLocaleString(localeFormat)}
+            {formatNumber(summary.totalInads)}
           </p>
         </div>
 
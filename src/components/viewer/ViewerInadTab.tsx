@@ -1,7 +1,8 @@
 'use client';
 
 import { useViewerStore } from '@/stores/viewerStore';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import { FileWarning, MapPin, Plane, TrendingUp } from 'lucide-react';
 import {
   BarChart,
@@ -23,8 +24,7 @@ export function ViewerInadTab() {
   const { publishedData } = useViewerStore();
   const t = useTranslations('viewer');
   const tInad = useTranslations('inad');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatNumber = useNumberFormatter();
 
   if (!publishedData) return null;
 
@@ -88,7 +88,7 @@ export function ViewerInadTab() {
             </span>
           </div>
           <p className="text-3xl font-bold text-neutral-900">
-            {summary.totalInads.toLocaleString(localeFormat)}
+            {formatNumber(summary.totalInads)}
           </p>
           <p className="text-sm text-neutral-500 mt-1">{metadata.semester}</p>
         </div>
@@ -165,7 +165,7 @@ export function ViewerInadTab() {
                 </Pie>
                 <Tooltip
                   formatter={(value) => [
-                    typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                    typeof value === 'number' ? formatNumber(value) : '–',
                     tInad('cases'),
                   ]}
                   contentStyle={{
@@ -183,7 +183,7 @@ export function ViewerInadTab() {
               <div>
                 <p className="font-medium text-neutral-900">{tInad('includedLabel')}</p>
                 <p className="text-sm text-neutral-500">
-                  {tInad('includedDescription', { count: (summary.includedInads ?? summary.totalInads).toLocaleString(localeFormat) })}
+                  {tInad('includedDescription', { count: formatNumber(summary.includedInads ?? summary.totalInads) })}
                 </p>
               </div>
             </div>
@@ -192,7 +192,7 @@ export function ViewerInadTab() {
               <div>
                 <p className="font-medium text-neutral-900">{tInad('excludedLabel')}</p>
                 <p className="text-sm text-neutral-500">
-                  {tInad('excludedDescription', { count: (summary.excludedInads ?? 0).toLocaleString(localeFormat) })}
+                  {tInad('excludedDescription', { count: formatNumber(summary.excludedInads ?? 0) })}
                 </p>
               </div>
             </div>
@@ -222,7 +222,7 @@ export function ViewerInadTab() {
                 />
                 <Tooltip
                   formatter={(value, name) => [
-                    typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                    typeof value === 'number' ? formatNumber(value) : '–',
                     name === 'inads' ? t('inads') : t('density'),
                   ]}
                   contentStyle={{
@@ -324,7 +324,7 @@ export function ViewerInadTab() {
                   />
                   <Tooltip
                     formatter={(value) => [
-                      typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                      typeof value === 'number' ? formatNumber(value) : '–',
                       t('inads'),
                     ]}
                     contentStyle={{
@@ -371,7 +371,7 @@ export function ViewerInadTab() {
                   />
                   <Tooltip
                     formatter={(value, name, props) => [
-                      typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                      typeof value === 'number' ? formatNumber(value) : '–',
                       (props as { payload?: { fullName?: string } }).payload?.fullName || t('inads'),
                     ]}
                     contentStyle={{
@@ -1,7 +1,8 @@
 'use client';
 
 import { useViewerStore } from '@/stores/viewerStore';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import { Users, TrendingUp, Calendar } from 'lucide-react';
 import {
   BarChart,
@@ -21,8 +22,7 @@ export function ViewerPaxTab() {
   const { publishedData } = useViewerStore();
   const t = useTranslations('viewer');
   const tPax = useTranslations('pax');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatNumber = useNumberFormatter();
 
   if (!publishedData) return null;
 
@@ -87,7 +87,7 @@ export function ViewerPaxTab() {
             </span>
           </div>
           <p className="text-3xl font-bold text-neutral-900">
-            {summary.totalPax.toLocaleString(localeFormat)}
+            {formatNumber(summary.totalPax)}
           </p>
           <p className="text-sm text-neutral-500 mt-1">{metadata.semester}</p>
         </div>
@@ -100,7 +100,7 @@ export function ViewerPaxTab() {
             </span>
           </div>
           <p className="text-3xl font-bold text-neutral-900">
-            {Math.round(avgPax).toLocaleString(localeFormat)}
+            {formatNumber(Math.round(avgPax))}
           </p>
           <p className="text-sm text-neutral-500 mt-1">{t('perSemester')}</p>
         </div>
@@ -148,7 +148,7 @@ export function ViewerPaxTab() {
                 />
                 <Tooltip
                   formatter={(value) => [
-                    typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                    typeof value === 'number' ? formatNumber(value) : '–',
                     tPax('passengers'),
                   ]}
                   contentStyle={{
@@ -200,7 +200,7 @@ export function ViewerPaxTab() {
                   />
                   <Tooltip
                     formatter={(value) => [
-                      typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                      typeof value === 'number' ? formatNumber(value) : '–',
                       t('inads'),
                     ]}
                     contentStyle={{
@@ -247,7 +247,7 @@ export function ViewerPaxTab() {
                   />
                   <Tooltip
                     formatter={(value, name, props) => [
-                      typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                      typeof value === 'number' ? formatNumber(value) : '–',
                       (props as { payload?: { fullName?: string } }).payload?.fullName || t('inads'),
                     ]}
                     contentStyle={{
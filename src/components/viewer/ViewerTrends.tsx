@@ -2,7 +2,8 @@
 
 import { useMemo, useState } from 'react';
 import { useViewerStore } from '@/stores/viewerStore';
-import { useTranslations, useLocale } from 'next-intl';
+import { useTranslations } from 'next-intl';
+import { useNumberFormatter } from '@/i18n/format';
 import {
   LineChart,
   Line,
@@ -53,8 +54,7 @@ function TrendIndicator({
 export function ViewerTrends() {
   const { publishedData } = useViewerStore();
   const t = useTranslations('trends');
-  const locale = useLocale();
-  const localeFormat = locale === 'fr' ? 'fr-CH' : 'de-CH';
+  const formatNumber = useNumberFormatter();
 
   // State for semester comparison selection
   const [compareSemester1, setCompareSemester1] = useState<string | null>(null);
@@ -229,13 +229,13 @@ export function ViewerTrends() {
                   <div className="flex justify-between items-baseline">
                     <span className="text-xs text-neutral-500">{comparisonData.semester1.semester}</span>
                     <span className="text-lg font-semibold text-neutral-700">
-                      {comparisonData.semester1.paxCount.toLocaleString(localeFormat)}
+                      {formatNumber(comparisonData.semester1.paxCount)}
                     </span>
                   </div>
                   <div className="flex justify-between items-baseline">
                     <span className="text-xs text-neutral-500">{comparisonData.semester2.semester}</span>
                     <span className="text-2xl font-bold text-neutral-900">
-                      {comparisonData.semester2.paxCount.toLocaleString(localeFormat)}
+                      {formatNumber(comparisonData.semester2.paxCount)}
                     </span>
                   </div>
                 </div>
@@ -262,13 +262,13 @@ export function ViewerTrends() {
                   <div className="flex justify-between items-baseline">
                     <span className="text-xs text-neutral-500">{comparisonData.semester1.semester}</span>
                     <span className="text-lg font-semibold text-neutral-700">
-                      {comparisonData.semester1.inadCount.toLocaleString(localeFormat)}
+                      {formatNumber(comparisonData.semester1.inadCount)}
                     </span>
                   </div>
                   <div className="flex justify-between items-baseline">
                     <span className="text-xs text-neutral-500">{comparisonData.semester2.semester}</span>
                     <span className="text-2xl font-bold text-neutral-900">
-                      {comparisonData.semester2.inadCount.toLocaleString(localeFormat)}
+                      {formatNumber(comparisonData.semester2.inadCount)}
                     </span>
                   </div>
                 </div>
@@ -335,7 +335,7 @@ export function ViewerTrends() {
               <YAxis tick={{ fontSize: 12, fill: '#737373' }} />
               <Tooltip
                 formatter={(value) => [
-                  typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                  typeof value === 'number' ? formatNumber(value) : '–',
                   t('refusals'),
                 ]}
                 contentStyle={{
@@ -385,7 +385,7 @@ export function ViewerTrends() {
                 />
                 <Tooltip
                   formatter={(value) => [
-                    typeof value === 'number' ? value.toLocaleString(localeFormat) : '–',
+                    typeof value === 'number' ? formatNumber(value) : '–',
                     t('passengers'),
                   ]}
                   contentStyle={{
@@ -3,7 +3,22 @@ export type Locale = (typeof locales)[number];
 
 export const defaultLocale: Locale = 'de';
 
-export const localeNames: Record<Locale, string> = {
+const localeSet: ReadonlySet<string> = new Set(locales);
+
+/**
+ * Check whether a value (e.g. from a cookie or header) is a supported locale
+ */
+export function isLocale(value: string | undefined): value is Locale {
+  return value !== undefined && localeSet.has(value);
+}
+
+export const localeNames: Readonly<Record<Locale, string>> = Object.freeze({
   de: 'Deutsch',
   fr: 'Français',
-};
+});
+
+// BCP 47 tags used for number and date formatting per UI locale
+export const intlLocales: Readonly<Record<Locale, string>> = Object.freeze({
+  de: 'de-CH',
+  fr: 'fr-CH',
+});
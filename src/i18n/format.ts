@@ -0,0 +1,72 @@
+import { useLocale } from 'next-intl';
+import { intlLocales } from './config';
+
+/**
+ * Resolve the Intl locale tag (e.g. "de-CH") for the active UI locale
+ */
+export function useIntlLocale(): string {
+  return intlLocales[useLocale()];
+}
+
+// Intl.NumberFormat instances are expensive to construct and are immutable,
+// so one instance per locale tag is created lazily and reused
+const numberFormats = new Map<string, Intl.NumberFormat>();
+
+/**
+ * Get the shared number formatter for an Intl locale tag
+ */
+export function getNumberFormat(intlLocale: string): Intl.NumberFormat {
+  let format = numberFormats.get(intlLocale);
+  if (!format) {
+    format = new Intl.NumberFormat(intlLocale);
+    numberFormats.set(intlLocale, format);
+  }
+  return format;
+}
+
+/**
+ * Get a number formatting function bound to the active UI locale. The
+ * function is resolved once per render and keeps its identity per locale,
+ * so it is safe to use in memo dependencies.
+ */
+export function useNumberFormatter(): (value: number) => string {
+  return getNumberFormat(useIntlLocale()).format;
+}
+
+// Date formatting options, compiled into one Intl.DateTimeFormat per locale
+// tag and style on first use. 'dateTime' matches Date#toLocaleString defaults.
+const DATE_STYLES = {
+  date: { year: 'numeric', month: '2-digit', day: '2-digit' },
+  dateTime: {
+    year: 'numeric',
+    month: 'numeric',
+    day: 'numeric',
+    hour: 'numeric',
+    minute: 'numeric',
+    second: 'numeric',
+  },
+} satisfies Record<string, Intl.DateTimeFormatOptions>;
+
+export type DateStyle = keyof typeof DATE_STYLES;
+
+const dateFormats = new Map<string, Intl.DateTimeFormat>();
+
+/**
+ * Get the shared date formatter for an Intl locale tag and style
+ */
+export function getDateFormat(intlLocale: string, style: DateStyle): Intl.DateTimeFormat {
+  const cacheKey = `${intlLocale}|${style}`;
+  let format = dateFormats.get(cacheKey);
+  if (!format) {
+    format = new Intl.DateTimeFormat(intlLocale, DATE_STYLES[style]);
+    dateFormats.set(cacheKey, format);
+  }
+  return format;
+}
+
+/**
+ * Get a date formatting function bound to the active UI locale
+ */
+export function useDateFormatter(style: DateStyle): (date: Date) => string {
+  return getDateFormat(useIntlLocale(), style).format;
+}
@@ -0,0 +1,11 @@
+import type { Locale } from './config';
+import type messages from '../../messages/de.json';
+
+// Type next-intl against the default locale catalog, so namespaces and
+// keys passed to useTranslations()/t() are checked at compile time
+declare module 'next-intl' {
+  interface AppConfig {
+    Locale: Locale;
+    Messages: typeof messages;
+  }
+}
@@ -1,18 +1,39 @@
 import { getRequestConfig } from 'next-intl/server';
+import type { AbstractIntlMessages } from 'next-intl';
 import { cookies } from 'next/headers';
-import { defaultLocale, locales, type Locale } from './config';
+import { defaultLocale, isLocale, type Locale } from './config';
+import type DefaultMessages from '../../messages/de.json';
+
+// One static loader per locale: each catalog is bundled as its own chunk and
+// a request only loads the catalog for its locale. Typing every loader
+// against the default catalog makes a key missing from a translation a
+// compile error, so catalogs are complete and need no runtime fallback.
+const messageLoaders: Record<Locale, () => Promise<{ default: typeof DefaultMessages }>> = {
+  de: () => import('../../messages/de.json'),
+  fr: () => import('../../messages/fr.json'),
+};
+
+/**
+ * Freeze a catalog and all its namespaces. The imported catalog module is
+ * shared by every request, so only the first request walks it.
+ */
+function deepFreeze(messages: AbstractIntlMessages): AbstractIntlMessages {
+  if (Object.isFrozen(messages)) return messages;
+  for (const value of Object.values(messages)) {
+    if (typeof value === 'object') deepFreeze(value);
+  }
+  return Object.freeze(messages);
+}
 
 export default getRequestConfig(async () => {
   const cookieStore = await cookies();
   const localeCookie = cookieStore.get('NEXT_LOCALE')?.value;
 
   // Validate locale from cookie
-  const locale: Locale = locales.includes(localeCookie as Locale)
-    ? (localeCookie as Locale)
-    : defaultLocale;
+  const locale: Locale = isLocale(localeCookie) ? localeCookie : defaultLocale;
 
   return {
     locale,
-    messages: (await import(`../../messages/${locale}.json`)).default,
+    messages: deepFreeze((await messageLoaders[locale]()).default),
   };
 });
@@ -2,18 +2,18 @@ import type { AnalysisConfig } from './types';
 
 // Refusal codes that are excluded from INAD count
 // These represent administrative issues, not actual carrier performance problems
-export const EXCLUDE_CODES = new Set([
+export const EXCLUDE_CODES: ReadonlySet<string> = new Set([
   'B1n', 'B2n', 'C4n', 'C5n', 'C8',
   'D1n', 'D2n', 'E', 'F1n', 'G', 'H', 'I'
 ]);
 
-// Default analysis configuration
-export const DEFAULT_CONFIG: AnalysisConfig = {
+// Default analysis configuration (frozen: shared by the store and all steps)
+export const DEFAULT_CONFIG: Readonly<AnalysisConfig> = Object.freeze({
   minInad: 6,                   // Minimum INADs for Steps 1 & 2
   minDensity: 0.10,             // Minimum density (‰) for HIGH_PRIORITY
   highPriorityMultiplier: 1.5,  // Must be 1.5× threshold for HIGH_PRIORITY
   highPriorityMinInad: 10,      // Must have 10+ INADs for HIGH_PRIORITY
-};
+});
 
 // Excel column mappings for INAD file
 export const INAD_COLUMNS = {
@@ -5,6 +5,7 @@ import type {
   Step2Result,
   Step3Result,
   AnalysisConfig,
+  Priority,
 } from './types';
 import type {
   PublishedData,
@@ -12,8 +13,21 @@ import type {
   PublishedAirline,
   PublishedTrendData,
 } from './publishTypes';
-import type { Semester } from '@/stores/analysisStore';
 import { DEFAULT_CONFIG } from './constants';
+import {
+  getSemesterMonths,
+  isInSemester,
+  filterBySemester,
+  getSemesterTotals,
+  type Semester,
+} from './semester';
+
+// Published classification for each analysis priority
+const PRIORITY_TO_CLASSIFICATION: Record<Priority, PublishedRoute['classification']> = {
+  HIGH_PRIORITY: 'sanction',
+  WATCH_LIST: 'watchList',
+  CLEAR: 'clear',
+};
 
 interface GeneratePublishDataParams {
   inadData: INADRecord[];
@@ -40,33 +54,29 @@ export function generatePublishData(params: GeneratePublishDataParams): Publishe
     config = DEFAULT_CONFIG,
   } = params;
 
-  // Filter data for selected semester
-  const startMonth = selectedSemester.half === 1 ? 1 : 7;
-  const endMonth = selectedSemester.half === 1 ? 6 : 12;
+  // Month range of the selected semester, published in the metadata
+  const { startMonth, endMonth } = getSemesterMonths(selectedSemester);
 
-  // All INAD data for the semester (both included and excluded)
-  const allSemesterInadData = inadData.filter(
-    (r) =>
-      r.year === selectedSemester.year &&
-      r.month >= startMonth &&
-      r.month <= endMonth
-  );
-
-  // Only included INADs (used for analysis)
-  const semesterInadData = allSemesterInadData.filter((r) => r.included);
-
-  // Count excluded INADs
-  const excludedInadCount = allSemesterInadData.filter((r) => !r.included).length;
+  // Single pass over the INAD data for the semester: count included and
+  // excluded INADs, and aggregate included ones by last stop and airline
+  let totalInads = 0;
+  let excludedInadCount = 0;
+  const lastStopCounts = new Map<string, number>();
+  const airlineCounts = new Map<string, number>();
+  for (const record of inadData) {
+    if (!isInSemester(record, selectedSemester)) continue;
+    if (!record.included) {
+      excludedInadCount++;
+      continue;
+    }
+    totalInads++;
+    lastStopCounts.set(record.lastStop, (lastStopCounts.get(record.lastStop) || 0) + 1);
+    airlineCounts.set(record.airline, (airlineCounts.get(record.airline) || 0) + 1);
+  }
 
-  const semesterBazlData = bazlData.filter(
-    (r) =>
-      r.year === selectedSemester.year &&
-      r.month >= startMonth &&
-      r.month <= endMonth
-  );
+  const semesterBazlData = filterBySemester(bazlData, selectedSemester);
 
   // Calculate summary
-  const totalInads = semesterInadData.length;
   const totalPax = semesterBazlData.reduce((sum, r) => sum + r.pax, 0);
 
   // Build airline name lookup from INAD data
@@ -89,15 +99,6 @@ export function generatePublishData(params: GeneratePublishDataParams): Publishe
   const airlinesAboveThreshold = airlines.filter((a) => a.aboveThreshold).length;
 
   // Routes from Step 3 - convert priority to classification
-  const priorityToClassification = (priority: string): 'sanction' | 'watchList' | 'clear' => {
-    switch (priority) {
-      case 'HIGH_PRIORITY': return 'sanction';
-      case 'WATCH_LIST': return 'watchList';
-      case 'CLEAR': return 'clear';
-      default: return 'clear';
-    }
-  };
-
   const routes: PublishedRoute[] = step3Results.map((r) => ({
     airline: r.airline,
     airlineName: airlineNameMap.get(r.airline) || r.airline,
@@ -105,70 +106,40 @@ export function generatePublishData(params: GeneratePublishDataParams): Publishe
     inadCount: r.inadCount,
     pax: r.pax,
     density: r.density,
-    classification: priorityToClassification(r.priority),
+    classification: PRIORITY_TO_CLASSIFICATION[r.priority],
   }));
 
   const routesAboveThreshold = step2Results.filter((r) => r.passesThreshold).length;
 
   // Top 10 Last Stops
-  const lastStopCounts = new Map<string, number>();
-  for (const record of semesterInadData) {
-    const count = lastStopCounts.get(record.lastStop) || 0;
-    lastStopCounts.set(record.lastStop, count + 1);
-  }
   const top10LastStops = Array.from(lastStopCounts.entries())
     .sort((a, b) => b[1] - a[1])
     .slice(0, 10)
     .map(([name, count]) => ({ name, count }));
 
   // Top 10 Airlines
-  const airlineCounts = new Map<string, number>();
-  for (const record of semesterInadData) {
-    const existing = airlineCounts.get(record.airline) || 0;
-    airlineCounts.set(record.airline, existing + 1);
-  }
   const top10Airlines = Array.from(airlineCounts.entries())
     .sort((a, b) => b[1] - a[1])
     .slice(0, 10)
     .map(([code, count]) => ({ code, name: code, count }));
 
   // Trend data for all available semesters
-  const trends: PublishedTrendData[] = availableSemesters
-    .slice()
-    .sort((a, b) => {
-      if (a.year !== b.year) return a.year - b.year;
-      return a.half - b.half;
-    })
-    .map((semester) => {
-      const semStart = semester.half === 1 ? 1 : 7;
-      const semEnd = semester.half === 1 ? 6 : 12;
-
-      const semInad = inadData.filter(
-        (r) =>
-          r.year === semester.year &&
-          r.month >= semStart &&
-          r.month <= semEnd &&
-          r.included
-      );
-
-      const semBazl = bazlData.filter(
-        (r) =>
-          r.year === semester.year &&
-          r.month >= semStart &&
-          r.month <= semEnd
-      );
-
-      const inadCount = semInad.length;
-      const paxCount = semBazl.reduce((sum, r) => sum + r.pax, 0);
-      const density = paxCount > 0 ? (inadCount / paxCount) * 1000 : null;
-
-      return {
-        semester: semester.label,
-        inadCount,
-        paxCount,
-        density: density !== null ? Number(density.toFixed(4)) : null,
-      };
-    });
+  const sortedSemesters = availableSemesters.slice().sort((a, b) => {
+    if (a.year !== b.year) return a.year - b.year;
+    return a.half - b.half;
+  });
+  const semesterTotals = getSemesterTotals(inadData, bazlData, sortedSemesters);
+  const trends: PublishedTrendData[] = sortedSemesters.map((semester, i) => {
+    const { inadCount, paxCount } = semesterTotals[i];
+    const density = paxCount > 0 ? (inadCount / paxCount) * 1000 : null;
+
+    return {
+      semester: semester.label,
+      inadCount,
+      paxCount,
+      density: density !== null ? Number(density.toFixed(4)) : null,
+    };
+  });
 
   return {
     metadata: {
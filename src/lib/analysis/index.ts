@@ -8,6 +8,7 @@ import { calculateStep3 } from './step3';
 export * from './types';
 export * from './constants';
 export * from './parseExcel';
+export * from './semester';
 export { calculateStep1, getStep1Summary } from './step1';
 export { calculateStep2, getStep2Summary } from './step2';
 export { calculateStep3, getStep3Summary } from './step3';
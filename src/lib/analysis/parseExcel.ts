@@ -2,6 +2,67 @@ import * as XLSX from 'xlsx';
 import type { INADRecord, BAZLRecord } from './types';
 import { EXCLUDE_CODES, SHEET_NAMES, INAD_COLUMNS, BAZL_COLUMNS } from './constants';
 
+/**
+ * Read the raw value of a single cell, treating empty and error cells as null
+ */
+function cellValue(sheet: XLSX.WorkSheet, address: string): unknown {
+  const cell = sheet[address] as XLSX.CellObject | undefined;
+  if (!cell || cell.t === 'z' || cell.t === 'e') return null;
+  return cell.v ?? null;
+}
+
+/**
+ * Build header -> column index map from the first row of the sheet range.
+ * Indices are relative to the first column, like sheet_to_json({ header: 1 }).
+ */
+function readHeaderIndex(sheet: XLSX.WorkSheet, range: XLSX.Range): Record<string, number> {
+  const headerIndex: Record<string, number> = {};
+  const headerRow = XLSX.utils.encode_row(range.s.r);
+  for (let c = range.s.c; c <= range.e.c; c++) {
+    const header = cellValue(sheet, XLSX.utils.encode_col(c) + headerRow);
+    if (header) {
+      headerIndex[String(header).trim()] = c - range.s.c;
+    }
+  }
+  return headerIndex;
+}
+
+/**
+ * Read the data rows below the header, projected to the given columns.
+ * sheet_to_json materialises every cell of every row although parsing only
+ * needs a handful of columns. Values keep their column position, so rows are
+ * indexed exactly like sheet_to_json output.
+ */
+function readProjectedRows(
+  sheet: XLSX.WorkSheet,
+  range: XLSX.Range,
+  columns: (number | undefined)[]
+): unknown[][] {
+  const wanted = columns.filter((c): c is number => c !== undefined);
+  const colNames = wanted.map((c) => XLSX.utils.encode_col(range.s.c + c));
+
+  const rows: unknown[][] = [];
+  for (let r = range.s.r + 1; r <= range.e.r; r++) {
+    const rowName = XLSX.utils.encode_row(r);
+    const row: unknown[] = [];
+    for (let k = 0; k < wanted.length; k++) {
+      row[wanted[k]] = cellValue(sheet, colNames[k] + rowName);
+    }
+    rows.push(row);
+  }
+  return rows;
+}
+
+/**
+ * Decode the used range of a sheet, or null if it has no data rows
+ */
+function getDataRange(sheet: XLSX.WorkSheet): XLSX.Range | null {
+  const ref = sheet['!ref'];
+  if (!ref) return null;
+  const range = XLSX.utils.decode_range(ref);
+  return range.e.r > range.s.r ? range : null;
+}
+
 /**
  * Parse INAD Excel file and return records
  */
@@ -17,20 +78,13 @@ export async function parseINADFile(file: File): Promise<INADRecord[]> {
     throw new Error(`Sheet "${SHEET_NAMES.inad}" not found in file`);
   }
 
-  // Convert to JSON with header row (returns array of arrays)
-  const rows = XLSX.utils.sheet_to_json<unknown[]>(sheet, { header: 1, defval: null });
-  if (rows.length < 2) {
+  const range = getDataRange(sheet);
+  if (!range) {
     throw new Error('No data found in INAD file');
   }
 
   // Build header index from first row
-  const headerRow = rows[0] as (string | undefined)[];
-  const headerIndex: Record<string, number> = {};
-  headerRow.forEach((header, index) => {
-    if (header) {
-      headerIndex[header.toString().trim()] = index;
-    }
-  });
+  const headerIndex = readHeaderIndex(sheet, range);
 
   // Get column indices
   const airlineIdx = headerIndex[INAD_COLUMNS.airline];
@@ -44,10 +98,15 @@ export async function parseINADFile(file: File): Promise<INADRecord[]> {
     throw new Error('Required columns not found in INAD file. Expected: Fluggesellschaft, Abflugort (last stop), Jahr, Monat');
   }
 
-  // Parse data rows (skip header)
+  // Read only the columns used below instead of the whole sheet
+  const rows = readProjectedRows(sheet, range, [
+    airlineIdx, lastStopIdx, yearIdx, monthIdx, refusalCodeIdx,
+  ]);
+
+  // Parse data rows
   const records: INADRecord[] = [];
-  for (let i = 1; i < rows.length; i++) {
-    const row = rows[i] as unknown[];
+  for (let i = 0; i < rows.length; i++) {
+    const row = rows[i];
     if (!row || row.length === 0) continue;
 
     const airline = String(row[airlineIdx] || '').trim();
@@ -138,20 +197,13 @@ export async function parseBAZLFile(file: File): Promise<BAZLRecord[]> {
     throw new Error(`Sheet "${SHEET_NAMES.bazl}" not found in file`);
   }
 
-  // Convert to JSON with header row (returns array of arrays)
-  const rows = XLSX.utils.sheet_to_json<unknown[]>(sheet, { header: 1 });
-  if (rows.length < 2) {
+  const range = getDataRange(sheet);
+  if (!range) {
     throw new Error('No data found in BAZL file');
   }
 
   // Build header index from first row
-  const headerRow = rows[0] as (string | undefined)[];
-  const headerIndex: Record<string, number> = {};
-  headerRow.forEach((header, index) => {
-    if (header) {
-      headerIndex[header.toString().trim()] = index;
-    }
-  });
+  const headerIndex = readHeaderIndex(sheet, range);
 
   // Get column indices - IATA preferred, ICAO used for lookup
   const airlineIataIdx = headerIndex[BAZL_COLUMNS.airline];
@@ -171,10 +223,15 @@ export async function parseBAZLFile(file: File): Promise<BAZLRecord[]> {
     throw new Error('Required columns not found in BAZL file. Expected: Airline Code (IATA/ICAO), Flughafen (IATA/ICAO), Passagiere / Passagers, Jahr, Monat');
   }
 
-  // Parse data rows (skip header)
+  // Read only the columns used below instead of the whole sheet
+  const rows = readProjectedRows(sheet, range, [
+    airlineIataIdx, airportIataIdx, airlineIcaoIdx, airportIcaoIdx, paxIdx, yearIdx, monthIdx,
+  ]);
+
+  // Parse data rows
   const records: BAZLRecord[] = [];
-  for (let i = 1; i < rows.length; i++) {
-    const row = rows[i] as unknown[];
+  for (let i = 0; i < rows.length; i++) {
+    const row = rows[i];
     if (!row || row.length === 0) continue;
 
     // Get IATA code - if empty, look up from ICAO using reference tables
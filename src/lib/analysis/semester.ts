@@ -0,0 +1,88 @@
+import type { INADRecord, BAZLRecord } from './types';
+
+export interface Semester {
+  year: number;
+  half: 1 | 2;
+  label: string;
+}
+
+/**
+ * First and last month (inclusive) covered by a semester
+ */
+export function getSemesterMonths(
+  semester: Pick<Semester, 'half'>
+): { startMonth: number; endMonth: number } {
+  return semester.half === 1 ? { startMonth: 1, endMonth: 6 } : { startMonth: 7, endMonth: 12 };
+}
+
+/**
+ * Check whether a record's year and month fall within a semester
+ */
+export function isInSemester(
+  record: { year: number; month: number },
+  semester: Pick<Semester, 'year' | 'half'>
+): boolean {
+  const { startMonth, endMonth } = getSemesterMonths(semester);
+  return record.year === semester.year && record.month >= startMonth && record.month <= endMonth;
+}
+
+/**
+ * Keep only the records that fall within a semester
+ */
+export function filterBySemester<T extends { year: number; month: number }>(
+  records: T[],
+  semester: Semester
+): T[] {
+  return records.filter((record) => isInSemester(record, semester));
+}
+
+const HALVES: readonly (1 | 2)[] = [1, 2];
+
+// Numeric key identifying a semester, for bucketing records by semester
+function semesterKey(semester: Pick<Semester, 'year' | 'half'>): number {
+  return semester.year * 2 + semester.half;
+}
+
+// Key of the semester containing a record, or null when its month falls in
+// neither half of the year
+function recordSemesterKey(record: { year: number; month: number }): number | null {
+  for (const half of HALVES) {
+    const semester = { year: record.year, half };
+    if (isInSemester(record, semester)) return semesterKey(semester);
+  }
+  return null;
+}
+
+/**
+ * Included INADs and PAX per semester, in the order of the given semesters.
+ * Records are bucketed by semester in one pass each, so the cost does not
+ * grow with the number of semesters.
+ */
+export function getSemesterTotals(
+  inadData: INADRecord[],
+  bazlData: BAZLRecord[],
+  semesters: Semester[]
+): { inadCount: number; paxCount: number }[] {
+  const inadBySemester = new Map<number, number>();
+  for (const r of inadData) {
+    if (!r.included) continue;
+    const key = recordSemesterKey(r);
+    if (key === null) continue;
+    inadBySemester.set(key, (inadBySemester.get(key) || 0) + 1);
+  }
+
+  const paxBySemester = new Map<number, number>();
+  for (const r of bazlData) {
+    const key = recordSemesterKey(r);
+    if (key === null) continue;
+    paxBySemester.set(key, (paxBySemester.get(key) || 0) + r.pax);
+  }
+
+  return semesters.map((semester) => {
+    const key = semesterKey(semester);
+    return {
+      inadCount: inadBySemester.get(key) || 0,
+      paxCount: paxBySemester.get(key) || 0,
+    };
+  });
+}
@@ -1,5 +1,6 @@
 import type { INADRecord, Step1Result, Step2Result } from './types';
 import { DEFAULT_CONFIG } from './constants';
+import { routeKey } from './utils';
 
 /**
  * Step 2 (Prüfstufe 2): Route Screening
@@ -19,30 +20,32 @@ export function calculateStep2(
       .map(r => r.airline)
   );
 
-  // Filter to included records from passing airlines
-  const included = inadData.filter(
-    r => r.included && passingAirlines.has(r.airline)
-  );
+  // Group included records from passing airlines by (airline, lastStop)
+  // route and count. Each entry keeps both parts of its route key.
+  const routes = new Map<string, Step2Result>();
+  for (const record of inadData) {
+    if (!record.included || !passingAirlines.has(record.airline)) continue;
 
-  // Group by (airline, lastStop) route and count
-  const counts = new Map<string, number>();
-  for (const record of included) {
-    const key = `${record.airline}|${record.lastStop}`;
-    counts.set(key, (counts.get(key) || 0) + 1);
+    const key = routeKey(record.airline, record.lastStop);
+    const route = routes.get(key);
+    if (route) {
+      route.inadCount++;
+    } else {
+      routes.set(key, {
+        airline: record.airline,
+        lastStop: record.lastStop,
+        inadCount: 1,
+        passesThreshold: false, // Will be set below
+      });
+    }
   }
 
   // Convert to results array with threshold check
-  const results: Step2Result[] = Array.from(counts.entries())
-    .map(([key, inadCount]) => {
-      const [airline, lastStop] = key.split('|');
-      return {
-        airline,
-        lastStop,
-        inadCount,
-        passesThreshold: inadCount >= minInad,
-      };
-    })
-    .sort((a, b) => b.inadCount - a.inadCount);
+  const results = Array.from(routes.values());
+  for (const route of results) {
+    route.passesThreshold = route.inadCount >= minInad;
+  }
+  results.sort((a, b) => b.inadCount - a.inadCount);
 
   return results;
 }
@@ -1,13 +1,22 @@
 import type { Step2Result, BAZLRecord, Step3Result, Priority, AnalysisConfig } from './types';
 import { DEFAULT_CONFIG } from './constants';
+import { routeKey } from './utils';
+
+// Sort rank per priority (HIGH_PRIORITY first)
+const PRIORITY_ORDER: Record<Priority, number> = {
+  HIGH_PRIORITY: 0,
+  WATCH_LIST: 1,
+  CLEAR: 2,
+};
 
 /**
  * Calculate median of an array of numbers
  */
-function median(values: number[]): number {
+function median(values: Float64Array): number {
   if (values.length === 0) return 0;
 
-  const sorted = [...values].sort((a, b) => a - b);
+  // Typed arrays sort numerically without a comparator callback
+  const sorted = values.slice().sort();
   const mid = Math.floor(sorted.length / 2);
 
   if (sorted.length % 2 === 0) {
@@ -18,13 +27,13 @@ function median(values: number[]): number {
 
 /**
  * Build PAX lookup map from BAZL data
- * Key: "airline|airport" -> total PAX
+ * Key: routeKey(airline, airport) -> total PAX
  */
 function buildPaxLookup(bazlData: BAZLRecord[]): Map<string, number> {
   const lookup = new Map<string, number>();
 
   for (const record of bazlData) {
-    const key = `${record.airline}|${record.airport}`;
+    const key = routeKey(record.airline, record.airport);
     lookup.set(key, (lookup.get(key) || 0) + record.pax);
   }
 
@@ -51,15 +60,24 @@ export function calculateStep3(
   // Get routes that passed Step 2 threshold
   const passingRoutes = step2Results.filter(r => r.passesThreshold);
 
-  // Calculate density for each route
-  const results: Step3Result[] = passingRoutes.map(route => {
-    const key = `${route.airline}|${route.lastStop}`;
+  // Calculate density for each route in a single pass, collecting the
+  // available densities for the threshold alongside
+  const results: Step3Result[] = new Array(passingRoutes.length);
+  const densities = new Float64Array(passingRoutes.length);
+  let densityCount = 0;
+
+  for (let i = 0; i < passingRoutes.length; i++) {
+    const route = passingRoutes[i];
+    const key = routeKey(route.airline, route.lastStop);
     const pax = paxLookup.get(key) || 0;
 
     // Calculate density (INAD per 1000 passengers)
     const density = pax > 0 ? (route.inadCount / pax) * 1000 : null;
+    if (density !== null) {
+      densities[densityCount++] = density;
+    }
 
-    return {
+    results[i] = {
       airline: route.airline,
       lastStop: route.lastStop,
       inadCount: route.inadCount,
@@ -67,14 +85,10 @@ export function calculateStep3(
       density,
       priority: 'CLEAR' as Priority, // Will be set below
     };
-  });
+  }
 
   // Calculate threshold from all densities
-  const allDensities = results
-    .filter(r => r.density !== null)
-    .map(r => r.density as number);
-
-  const threshold = allDensities.length > 0 ? median(allDensities) : 0;
+  const threshold = densityCount > 0 ? median(densities.subarray(0, densityCount)) : 0;
 
   // Classify priorities based on threshold
   for (const result of results) {
@@ -82,17 +96,10 @@ export function calculateStep3(
   }
 
   // Sort by priority (HIGH_PRIORITY first), then by density descending
-  const priorityOrder: Record<Priority, number> = {
-    HIGH_PRIORITY: 0,
-    WATCH_LIST: 1,
-    CLEAR: 2,
-  };
-
-  results.sort((a, b) => {
-    const orderDiff = priorityOrder[a.priority] - priorityOrder[b.priority];
-    if (orderDiff !== 0) return orderDiff;
-    return (b.density || 0) - (a.density || 0);
-  });
+  results.sort((a, b) =>
+    PRIORITY_ORDER[a.priority] - PRIORITY_ORDER[b.priority] ||
+    (b.density || 0) - (a.density || 0)
+  );
 
   return { results, threshold };
 }
@@ -0,0 +1,7 @@
+/**
+ * Lookup key for an (airline, last stop) route. The NUL separator cannot
+ * occur in airline or airport codes, so distinct routes never share a key.
+ */
+export function routeKey(airline: string, lastStop: string): string {
+  return `${airline}\u0000${lastStop}`;
+}
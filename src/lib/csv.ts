@@ -15,3 +15,20 @@ export function toSafeCsvField(value: unknown, delimiter = ';'): string {
 
   return field;
 }
+
+/**
+ * Download rows as a CSV file
+ */
+export function downloadCsv(fileName: string, lines: string[][], delimiter = ';'): void {
+  const csv = lines.map((line) => line.join(delimiter)).join('\n');
+
+  const blob = new Blob([csv], { type: 'text/csv;charset=utf-8;' });
+  const url = URL.createObjectURL(blob);
+  const link = document.createElement('a');
+  link.href = url;
+  link.download = fileName;
+  document.body.appendChild(link);
+  link.click();
+  document.body.removeChild(link);
+  URL.revokeObjectURL(url);
+}
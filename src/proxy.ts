@@ -1,6 +1,6 @@
 import { NextResponse } from 'next/server';
 import type { NextRequest } from 'next/server';
-import { defaultLocale, locales, type Locale } from './i18n/config';
+import { defaultLocale, isLocale, type Locale } from './i18n/config';
 import { SESSION_COOKIE_NAME, verifySessionToken } from './lib/auth/session';
 
 const LOCALE_COOKIE = 'NEXT_LOCALE';
@@ -8,8 +8,8 @@ const LOCALE_COOKIE = 'NEXT_LOCALE';
 function getPreferredLocale(request: NextRequest): Locale {
   // Check if user has a stored preference
   const cookieLocale = request.cookies.get(LOCALE_COOKIE)?.value;
-  if (cookieLocale && locales.includes(cookieLocale as Locale)) {
-    return cookieLocale as Locale;
+  if (isLocale(cookieLocale)) {
+    return cookieLocale;
   }
 
   // Parse Accept-Language header
@@ -29,8 +29,8 @@ function getPreferredLocale(request: NextRequest): Locale {
 
     // Find the first matching locale
     for (const lang of languages) {
-      if (locales.includes(lang.code as Locale)) {
-        return lang.code as Locale;
+      if (isLocale(lang.code)) {
+        return lang.code;
       }
     }
   }
@@ -7,13 +7,7 @@ import type {
   Step3Result,
   AnalysisConfig,
 } from '@/lib/analysis/types';
-import { DEFAULT_CONFIG, runFullAnalysis } from '@/lib/analysis';
-
-export interface Semester {
-  year: number;
-  half: 1 | 2;
-  label: string;
-}
+import { DEFAULT_CONFIG, runFullAnalysis, filterBySemester, type Semester } from '@/lib/analysis';
 
 function getSemester(year: number, month: number): Semester {
   const half = month <= 6 ? 1 : 2;
@@ -24,21 +18,6 @@ function getSemester(year: number, month: number): Semester {
   };
 }
 
-function filterBySemester<T extends { year: number; month: number }>(
-  records: T[],
-  semester: Semester
-): T[] {
-  const startMonth = semester.half === 1 ? 1 : 7;
-  const endMonth = semester.half === 1 ? 6 : 12;
-
-  return records.filter(
-    (record) =>
-      record.year === semester.year &&
-      record.month >= startMonth &&
-      record.month <= endMonth
-  );
-}
-
 function extractAllSemesters(
   inadData: { year: number; month: number }[] | null,
   bazlData: { year: number; month: number }[] | null